@@ -4,23 +4,19 @@ API Models
 Pydantic models for API requests and responses.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional, List
-import os
 
 class ScanRequest(BaseModel):
-    """Request model for repository scan."""
+    """Request model for repository scan.
+
+    The repository path is checked in the route handler rather than a
+    validator, keeping filesystem I/O out of the Pydantic constructor.
+    """
     repo_path: str = Field(..., description="Path to the Go repository")
     config_overrides: Optional[Dict[str, Any]] = Field(
         None, description="Optional configuration overrides"
     )
-    
-    @validator('repo_path')
-    def validate_repo_path(cls, v):
-        """Validate that the repository path exists."""
-        if not os.path.isdir(v):
-            raise ValueError(f"Repository path does not exist: {v}")
-        return v
 
 class CategoryScore(BaseModel):
     """Model for category scores."""
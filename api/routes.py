@@ -6,16 +6,25 @@ FastAPI routes for the technical debt scanner API.
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Request
 from typing import Dict, Any, List
+from itertools import islice
+import asyncio
+import json
 import uuid
 import os
 from .models import ScanRequest, ScanResponse, ScanStatus, HealthResponse
 from .services import scan_repository, check_go_tools
+from .storage import create_backend
 
 # Create router
 router = APIRouter()
 
-# Store for scan results (in-memory for simplicity, use a database in production)
-scan_results = {}
+# Store for scan results; backend selected via SCAN_STORAGE (in-memory by
+# default, diskcache/Redis for persistence and multi-worker deployments)
+scan_results = create_backend()
+
+# Results above this size are trimmed to their scores so a single huge
+# repo cannot dominate the result store
+MAX_RESULT_BYTES = int(os.environ.get('MAX_RESULT_BYTES', 8 * 1024 * 1024))
 
 @router.post("/scan", response_model=ScanStatus, status_code=202)
 async def start_scan(
@@ -28,25 +37,31 @@ async def start_scan(
     
     Returns a scan ID that can be used to check the status and retrieve results.
     """
+    # Validate the repository path off the event loop; the disk stat used
+    # to live in a Pydantic validator and block the loop on every request
+    if not await asyncio.to_thread(os.path.isdir, request.repo_path):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Repository path does not exist: {request.repo_path}"
+        )
+
     # Generate a unique scan ID
     scan_id = str(uuid.uuid4())
     
     # Store initial status
-    scan_results[scan_id] = {
-        "status": "pending",
-        "repo_path": request.repo_path,
-        "message": "Scan queued"
-    }
+    _store_status(scan_id, request.repo_path, "pending", "Scan queued")
     
-    # Get configuration
+    # Get configuration; merge overrides into a fresh dict so the shared
+    # app config is never mutated by a request
     config = req.app.state.config
     if request.config_overrides:
-        # Deep merge the overrides
+        merged = dict(config)
         for category, values in request.config_overrides.items():
-            if category in config and isinstance(values, dict):
-                config[category].update(values)
+            if isinstance(values, dict) and isinstance(merged.get(category), dict):
+                merged[category] = {**merged[category], **values}
             else:
-                config[category] = values
+                merged[category] = values
+        config = merged
     
     # Start scan in background
     background_tasks.add_task(
@@ -70,23 +85,28 @@ async def get_scan_result(scan_id: str):
     If the scan is complete, returns the full results.
     If the scan is still running, returns the current status.
     """
-    if scan_id not in scan_results:
+    result = scan_results.get(scan_id)
+    if result is None:
         raise HTTPException(status_code=404, detail="Scan not found")
-    
-    return scan_results[scan_id]
+
+    return result
 
 @router.get("/scans", response_model=Dict[str, Dict[str, Any]])
-async def list_scans():
+async def list_scans(limit: int = 100, offset: int = 0):
     """
-    List all scans and their statuses.
+    List scans and their statuses, paginated with limit/offset.
+
+    Only the requested page is materialized and serialized, so servers
+    with a long scan history are not forced into an O(N) response.
     """
+    page = islice(scan_results.items(), offset, offset + limit)
     return {
         scan_id: {
             "status": data.get("status", "unknown"),
             "repo_path": data.get("repo_path", ""),
             "message": data.get("message", "")
         }
-        for scan_id, data in scan_results.items()
+        for scan_id, data in page
     }
 
 @router.delete("/scan/{scan_id}", status_code=204)
@@ -94,10 +114,9 @@ async def delete_scan(scan_id: str):
     """
     Delete a scan result.
     """
-    if scan_id not in scan_results:
+    if not scan_results.delete(scan_id):
         raise HTTPException(status_code=404, detail="Scan not found")
-    
-    del scan_results[scan_id]
+
     return None
 
 @router.get("/health", response_model=HealthResponse)
@@ -113,29 +132,51 @@ async def health_check():
         "go_tools": go_tools
     }
 
+def _store_status(scan_id: str, repo_path: str, status: str, message: str,
+                  extra: Dict[str, Any] = None):
+    """Store a scan status as one atomic replacement.
+
+    Writing the complete record in a single set() means list_scans and
+    get_scan_result never observe a half-updated entry.
+    """
+    scan_results.set(scan_id, {
+        "status": status,
+        "repo_path": repo_path,
+        "message": message,
+        **(extra or {})
+    })
+
 async def run_scan_task(scan_id: str, repo_path: str, config: Dict[str, Any]):
     """
     Run the technical debt scan in the background.
     """
     try:
         # Update status to running
-        scan_results[scan_id]["status"] = "running"
-        scan_results[scan_id]["message"] = "Scan in progress"
-        
+        _store_status(scan_id, repo_path, "running", "Scan in progress")
+
         # Run the scan
         results = await scan_repository(repo_path, config)
-        
-        # Update with results
-        scan_results[scan_id] = {
-            "status": "completed",
-            "repo_path": repo_path,
-            "message": "Scan completed successfully",
-            **results
-        }
+
+        # Update with results. The size probe serializes the whole
+        # payload, which for a near-limit result takes long enough to
+        # stall other requests, so run it off the event loop.
+        encoded = await asyncio.to_thread(json.dumps, results, default=str)
+        if len(encoded) > MAX_RESULT_BYTES:
+            _store_status(
+                scan_id, repo_path, "completed",
+                "Scan completed successfully (detailed metrics omitted: result too large)",
+                extra={
+                    "overall_score": results.get("overall_score"),
+                    "overall_level": results.get("overall_level"),
+                    "category_scores": results.get("category_scores")
+                }
+            )
+        else:
+            _store_status(
+                scan_id, repo_path, "completed",
+                "Scan completed successfully",
+                extra=results
+            )
     except Exception as e:
         # Update with error
-        scan_results[scan_id] = {
-            "status": "failed",
-            "repo_path": repo_path,
-            "message": f"Scan failed: {str(e)}"
-        }
\ No newline at end of file
+        _store_status(scan_id, repo_path, "failed", f"Scan failed: {str(e)}")
\ No newline at end of file
@@ -6,29 +6,77 @@ Service layer for repository scanning.
 
 import os
 import asyncio
+import functools
+import hashlib
+import json
+import shutil
 import subprocess
-from typing import Dict, Any, List
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from scanner.repo_scanner import RepoScanner
 from scoring.thresholds import DebtThresholds
 
+# Scans are CPU-heavy on top of their subprocess work; running them in a
+# process pool keeps the uvicorn event loop responsive for health/list
+# requests while scans are in flight. Workers are spawned on first use.
+SCAN_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+# Completed scans keyed by (repo_path, HEAD commit, config hash).
+# Re-scanning an unchanged commit with the same config is pure repeated
+# work, so serve it from memory (LRU, bounded) instead of re-running
+# every analyzer.
+_scan_cache: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+_SCAN_CACHE_MAX_SIZE = 128
+
+def _scan_cache_key(repo_path: str, config: Dict[str, Any]) -> Optional[Tuple[str, str, str]]:
+    """Build a cache key for a scan, or None if the repo has no HEAD."""
+    try:
+        head = subprocess.check_output(
+            ['git', '-C', repo_path, 'rev-parse', 'HEAD'],
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+    config_hash = hashlib.sha1(
+        json.dumps(config, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+    return (repo_path, head, config_hash)
+
 async def scan_repository(repo_path: str, config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Scan a repository for technical debt.
-    
+
     Args:
         repo_path: Path to the repository
         config: Configuration dictionary
-        
+
     Returns:
         Dictionary with scan results
     """
-    # Run the scan in a separate thread to avoid blocking
-    loop = asyncio.get_event_loop()
-    results = await loop.run_in_executor(
-        None,
-        lambda: _run_scan(repo_path, config)
-    )
-    
+    # Serve repeat scans of the same commit + config from the cache. The
+    # key needs a git rev-parse fork, so build it off the event loop
+    # like the other per-request disk/subprocess work.
+    cache_key = await asyncio.to_thread(_scan_cache_key, repo_path, config)
+    if cache_key is not None and cache_key in _scan_cache:
+        _scan_cache.move_to_end(cache_key)
+        return _scan_cache[cache_key]
+
+    # Run the scan in the process pool to avoid blocking the event loop.
+    # get_running_loop is the non-deprecated accessor inside coroutines,
+    # and _run_scan is passed by reference so it pickles for the pool.
+    loop = asyncio.get_running_loop()
+    results = await loop.run_in_executor(SCAN_POOL, _run_scan, repo_path, config)
+
+    if cache_key is not None:
+        _scan_cache[cache_key] = results
+        while len(_scan_cache) > _SCAN_CACHE_MAX_SIZE:
+            _scan_cache.popitem(last=False)
+
     return results
 
 def _run_scan(repo_path: str, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -72,29 +120,30 @@ def _run_scan(repo_path: str, config: Dict[str, Any]) -> Dict[str, Any]:
     
     return final_results
 
+# How long a tool-availability probe stays valid; health checks within
+# the window reuse the cached answer
+_TOOL_CHECK_TTL_SECONDS = 30
+
+@functools.lru_cache(maxsize=1)
+def _check_go_tools_cached(epoch: int) -> Dict[str, bool]:
+    """Probe PATH for the required Go tools.
+
+    `epoch` rotates every _TOOL_CHECK_TTL_SECONDS, expiring the cache.
+    """
+    required_tools = [
+        'go', 'gocyclo', 'gocognit', 'scc',
+        'golangci-lint', 'golint', 'git'
+    ]
+
+    # shutil.which walks PATH in-process, avoiding a `which` subprocess
+    # fork per tool on every call
+    return {tool: shutil.which(tool) is not None for tool in required_tools}
+
 def check_go_tools() -> Dict[str, bool]:
     """
     Check if required Go tools are installed.
-    
+
     Returns:
         Dictionary with tool availability
     """
-    required_tools = [
-        'go', 'gocyclo', 'gocognit', 'scc', 
-        'golangci-lint', 'golint', 'git'
-    ]
-    
-    tool_availability = {}
-    for tool in required_tools:
-        try:
-            subprocess.run(
-                ['which', tool], 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, 
-                check=True
-            )
-            tool_availability[tool] = True
-        except subprocess.CalledProcessError:
-            tool_availability[tool] = False
-    
-    return tool_availability
\ No newline at end of file
+    return _check_go_tools_cached(int(time.monotonic() // _TOOL_CHECK_TTL_SECONDS))
\ No newline at end of file
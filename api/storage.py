@@ -0,0 +1,141 @@
+"""
+Scan Result Storage
+
+Pluggable storage backends for scan results. The in-memory backend keeps
+the original module-dict behaviour and remains the default; the diskcache
+and Redis backends persist results across restarts and can be shared
+between uvicorn workers.
+
+The backend is selected with the SCAN_STORAGE environment variable:
+
+    SCAN_STORAGE=memory                  (default)
+    SCAN_STORAGE=disk:/var/cache/debt-scanner
+    SCAN_STORAGE=redis://localhost:6379/0
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+class CacheBackend:
+    """Interface for scan result storage backends."""
+
+    def get(self, scan_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result for a scan, or None."""
+        raise NotImplementedError
+
+    def set(self, scan_id: str, value: Dict[str, Any]) -> None:
+        """Store the result for a scan."""
+        raise NotImplementedError
+
+    def delete(self, scan_id: str) -> bool:
+        """Delete a scan result. Returns True if it existed."""
+        raise NotImplementedError
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over (scan_id, result) pairs."""
+        raise NotImplementedError
+
+    def __contains__(self, scan_id: str) -> bool:
+        return self.get(scan_id) is not None
+
+class InMemoryBackend(CacheBackend):
+    """Process-local storage (single-worker deployments only).
+
+    Bounded by an LRU size cap and a TTL so long-running servers do not
+    accumulate scan payloads without limit.
+    """
+
+    def __init__(self, maxsize=512, ttl=24 * 3600):
+        self._results: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, scan_id):
+        entry = self._results.get(scan_id)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self._ttl:
+            del self._results[scan_id]
+            return None
+
+        self._results.move_to_end(scan_id)
+        return value
+
+    def set(self, scan_id, value):
+        self._results[scan_id] = (time.monotonic(), value)
+        self._results.move_to_end(scan_id)
+        while len(self._results) > self._maxsize:
+            self._results.popitem(last=False)
+
+    def delete(self, scan_id):
+        return self._results.pop(scan_id, None) is not None
+
+    def items(self):
+        now = time.monotonic()
+        for scan_id, (stored_at, value) in list(self._results.items()):
+            if now - stored_at <= self._ttl:
+                yield scan_id, value
+
+class DiskCacheBackend(CacheBackend):
+    """Persistent storage backed by diskcache with LRU eviction."""
+
+    def __init__(self, directory, size_limit=2 ** 30):
+        import diskcache
+        self._cache = diskcache.Cache(directory, size_limit=size_limit)
+
+    def get(self, scan_id):
+        return self._cache.get(scan_id)
+
+    def set(self, scan_id, value):
+        self._cache.set(scan_id, value)
+
+    def delete(self, scan_id):
+        return self._cache.delete(scan_id)
+
+    def items(self):
+        for scan_id in list(self._cache.iterkeys()):
+            value = self._cache.get(scan_id)
+            if value is not None:
+                yield scan_id, value
+
+class RedisBackend(CacheBackend):
+    """Shared storage backed by Redis (multi-worker deployments)."""
+
+    _PREFIX = 'debt-scanner:scan:'
+
+    def __init__(self, url, ttl=24 * 3600):
+        import redis
+        self._redis = redis.Redis.from_url(url)
+        self._ttl = ttl
+
+    def get(self, scan_id):
+        value = self._redis.get(self._PREFIX + scan_id)
+        return json.loads(value) if value is not None else None
+
+    def set(self, scan_id, value):
+        self._redis.set(self._PREFIX + scan_id, json.dumps(value), ex=self._ttl)
+
+    def delete(self, scan_id):
+        return bool(self._redis.delete(self._PREFIX + scan_id))
+
+    def items(self):
+        for key in self._redis.scan_iter(match=self._PREFIX + '*'):
+            scan_id = key.decode()[len(self._PREFIX):]
+            value = self.get(scan_id)
+            if value is not None:
+                yield scan_id, value
+
+def create_backend(spec: Optional[str] = None) -> CacheBackend:
+    """Create the storage backend described by `spec` (or SCAN_STORAGE)."""
+    spec = spec or os.environ.get('SCAN_STORAGE', 'memory')
+
+    if spec.startswith('redis://') or spec.startswith('rediss://'):
+        return RedisBackend(spec)
+    if spec.startswith('disk:'):
+        return DiskCacheBackend(spec[len('disk:'):])
+    return InMemoryBackend()
@@ -4,6 +4,7 @@ Go Technical Debt Scanner - CLI Entry Point
 """
 
 import argparse
+import bisect
 import os
 import sys
 import yaml
@@ -20,6 +21,8 @@ def parse_args():
                         help='Output report file path')
     parser.add_argument('--json', '-j', action='store_true',
                         help='Output in JSON format instead of Markdown')
+    parser.add_argument('--jobs', '-n', type=int, default=None,
+                        help='Maximum number of analyzers to run concurrently')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose output')
     return parser.parse_args()
@@ -36,7 +39,10 @@ def main():
     # Load configuration
     with open(args.config, 'r') as f:
         config = yaml.safe_load(f)
-    
+
+    if args.jobs:
+        config['jobs'] = args.jobs
+
     # Initialize scanner
     scanner = RepoScanner(args.repo_path, config, verbose=args.verbose)
     
@@ -57,11 +63,13 @@ def main():
     print(f"Technical debt report generated: {args.output}")
     print(f"Overall debt score: {results['overall_score']:.2f}/100")
     
-    # Print summary of debt categories
+    # Print summary of debt categories. The thresholds are hoisted into a
+    # sorted cut list once; bisect then resolves each level in one call.
     print("\nDebt breakdown:")
+    levels = ('LOW', 'MEDIUM', 'HIGH')
+    cuts = [config['thresholds']['medium'], config['thresholds']['high']]
     for category, score in results['category_scores'].items():
-        level = "HIGH" if score > config['thresholds']['high'] else \
-               "MEDIUM" if score > config['thresholds']['medium'] else "LOW"
+        level = levels[bisect.bisect_right(cuts, score)]
         print(f"  {category}: {score:.2f}/100 ({level})")
 
 if __name__ == "__main__":
@@ -10,13 +10,23 @@ import yaml
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+
 from api.routes import router
 
+try:
+    # Serialize responses with orjson when available; large scan payloads
+    # encode several times faster than with stdlib json
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
+
 # Create FastAPI app
 app = FastAPI(
     title="Go Technical Debt Scanner API",
     description="API for analyzing technical debt in Go repositories",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponse
 )
 
 # Add CORS middleware
@@ -50,4 +60,22 @@ async def startup_event():
         }
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # Reload is development-only (set DEV=1). One worker is the default:
+    # the default in-memory result store is per-process, so with several
+    # workers a GET /scan/{id} can land on a worker that never saw the
+    # scan. Opting in with WORKERS > 1 therefore requires a shared store
+    # (SCAN_STORAGE=disk:... or redis://...).
+    dev_mode = bool(os.getenv("DEV"))
+    workers = 1 if dev_mode else int(os.getenv("WORKERS", "1"))
+    if workers > 1 and os.getenv("SCAN_STORAGE", "memory") == "memory":
+        raise SystemExit(
+            "WORKERS > 1 needs a shared result store; "
+            "set SCAN_STORAGE=disk:<path> or SCAN_STORAGE=redis://..."
+        )
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        reload=dev_mode
+    )
\ No newline at end of file
@@ -4,8 +4,11 @@ Code Churn Analyzer
 Analyzes code churn and stability metrics.
 """
 
+import heapq
+import os
+
 from scanner.git_analyzer import GitAnalyzer
-from scoring.normalizer import ScoreNormalizer
+from scoring.normalizer import NORMALIZER
 
 class ChurnAnalyzer:
     """Analyzer for code churn and stability."""
@@ -17,7 +20,7 @@ class ChurnAnalyzer:
             config: Configuration dictionary
         """
         self.config = config
-        self.normalizer = ScoreNormalizer()
+        self.normalizer = NORMALIZER
     
     def analyze(self, repo_path, go_files):
         """Analyze code churn and stability.
@@ -29,21 +32,32 @@ class ChurnAnalyzer:
         Returns:
             Dictionary with churn metrics
         """
-        # Initialize Git analyzer
-        git_analyzer = GitAnalyzer(repo_path)
+        # Use the shared Git analyzer for this repository so its memoized
+        # queries are reused by any other consumer of the same repo
+        git_analyzer = GitAnalyzer.for_repo(repo_path)
         
+        period = self.config['churn']['analysis_period_days']
+
         # Get repository-level churn
-        repo_churn = git_analyzer.get_repo_churn(
-            days=self.config['churn']['analysis_period_days']
-        )
-        
-        # Get file-level churn for each Go file
+        repo_churn = git_analyzer.get_repo_churn(days=period)
+
+        # Get file-level churn from a single batched git log pass instead
+        # of one subprocess per file. The batch reports repo-relative
+        # paths, so map them back onto the absolute paths we were given;
+        # slicing off the repo prefix avoids relpath's normalization work
+        # (and its stat-related calls) per file.
+        all_churn = git_analyzer.get_all_file_churn(days=period)
+        prefix = repo_path.rstrip(os.sep) + os.sep
+        prefix_len = len(prefix)
         file_churn = {}
         for file_path in go_files:
-            file_churn[file_path] = git_analyzer.get_file_churn(
-                file_path,
-                days=self.config['churn']['analysis_period_days']
-            )
+            if file_path.startswith(prefix):
+                rel_path = file_path[prefix_len:]
+            else:
+                rel_path = os.path.relpath(file_path, repo_path)
+            file_churn[file_path] = all_churn.get(rel_path) or {
+                'commits': 0, 'additions': 0, 'deletions': 0, 'churn_rate': 0
+            }
         
         # Calculate average churn rate across files
         total_churn_rate = sum(data['churn_rate'] for data in file_churn.values())
@@ -61,8 +75,10 @@ class ChurnAnalyzer:
                     'deletions': data['deletions']
                 })
         
-        # Sort by churn rate
-        high_churn_files.sort(key=lambda x: x['churn_rate'], reverse=True)
+        # Take the top 10 by churn rate without sorting the full list
+        high_churn_files = heapq.nlargest(
+            10, high_churn_files, key=lambda x: x['churn_rate']
+        )
         
         # Calculate normalized score (0-100, where 0 is best)
         churn_score = self.normalizer.normalize_churn(
@@ -74,6 +90,6 @@ class ChurnAnalyzer:
         return {
             'repository_churn': repo_churn,
             'average_churn_rate': avg_churn_rate,
-            'high_churn_files': high_churn_files[:10],  # Top 10
+            'high_churn_files': high_churn_files,  # Top 10
             'score': churn_score
         }
\ No newline at end of file
@@ -4,8 +4,10 @@ Complexity Analyzer
 Analyzes code complexity metrics including cyclomatic and cognitive complexity.
 """
 
+import heapq
+
 from scanner.go_tools import GoToolRunner
-from scoring.normalizer import ScoreNormalizer
+from scoring.normalizer import NORMALIZER
 
 class ComplexityAnalyzer:
     """Analyzer for code complexity metrics."""
@@ -17,7 +19,7 @@ class ComplexityAnalyzer:
             config: Configuration dictionary
         """
         self.config = config
-        self.normalizer = ScoreNormalizer()
+        self.normalizer = NORMALIZER
         
         # Get thresholds from config
         self.cyclomatic_threshold = config.get('complexity', {}).get('cyclomatic_threshold', 15)
@@ -53,18 +55,14 @@ class ComplexityAnalyzer:
         cyclomatic_violations = len(cyclomatic_results['functions'])
         cognitive_violations = len(cognitive_results['functions'])
         
-        # Find worst offenders
-        cyclomatic_offenders = sorted(
-            cyclomatic_results['functions'], 
-            key=lambda x: x['complexity'], 
-            reverse=True
-        )[:10]
-        
-        cognitive_offenders = sorted(
-            cognitive_results['functions'], 
-            key=lambda x: x['complexity'], 
-            reverse=True
-        )[:10]
+        # Find the 10 worst offenders without sorting the full lists
+        cyclomatic_offenders = heapq.nlargest(
+            10, cyclomatic_results['functions'], key=lambda x: x['complexity']
+        )
+
+        cognitive_offenders = heapq.nlargest(
+            10, cognitive_results['functions'], key=lambda x: x['complexity']
+        )
         
         # Calculate normalized scores (0-100, where 0 is best)
         cyclomatic_score = self.normalizer.normalize_complexity(
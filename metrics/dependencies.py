@@ -5,7 +5,7 @@ Analyzes dependency health including outdated and vulnerable dependencies.
 """
 
 from scanner.go_tools import GoToolRunner
-from scoring.normalizer import ScoreNormalizer
+from scoring.normalizer import NORMALIZER
 import subprocess
 import json
 
@@ -19,7 +19,7 @@ class DependencyAnalyzer:
             config: Configuration dictionary
         """
         self.config = config
-        self.normalizer = ScoreNormalizer()
+        self.normalizer = NORMALIZER
     
     def analyze(self, repo_path, go_files):
         """Analyze dependency health.
@@ -55,18 +55,38 @@ class DependencyAnalyzer:
         # Check for vulnerable dependencies using govulncheck if available
         vulnerable_deps = []
         try:
-            cmd = ['govulncheck', './...']
+            cmd = ['govulncheck', '-json', './...']
             result = subprocess.run(
                 cmd,
                 cwd=repo_path,
                 capture_output=True,
                 text=True
             )
-            
-            # Parse govulncheck output (simplified)
-            for line in result.stdout.splitlines():
-                if 'vulnerability' in line.lower():
-                    vulnerable_deps.append(line)
+
+            # govulncheck -json emits a stream of JSON objects; walk it
+            # with raw_decode and count the distinct OSV ids it reports
+            decoder = json.JSONDecoder()
+            output = result.stdout
+            pos, length = 0, len(output)
+            osv_ids = set()
+            while pos < length:
+                while pos < length and output[pos] in ' \t\r\n':
+                    pos += 1
+                if pos >= length:
+                    break
+                try:
+                    obj, pos = decoder.raw_decode(output, pos)
+                except ValueError:
+                    break
+                if not isinstance(obj, dict):
+                    continue
+                finding = obj.get('finding')
+                if isinstance(finding, dict) and finding.get('osv'):
+                    osv_ids.add(finding['osv'])
+                osv = obj.get('osv')
+                if isinstance(osv, dict) and osv.get('id'):
+                    osv_ids.add(osv['id'])
+            vulnerable_deps = sorted(osv_ids)
         except (subprocess.SubprocessError, FileNotFoundError):
             # govulncheck not available
             pass
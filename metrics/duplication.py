@@ -4,8 +4,10 @@ Duplication Analyzer
 Analyzes code duplication using SCC tool.
 """
 
+import heapq
+
 from scanner.go_tools import GoToolRunner
-from scoring.normalizer import ScoreNormalizer
+from scoring.normalizer import NORMALIZER
 
 class DuplicationAnalyzer:
     """Analyzer for code duplication."""
@@ -17,7 +19,7 @@ class DuplicationAnalyzer:
             config: Configuration dictionary
         """
         self.config = config
-        self.normalizer = ScoreNormalizer()
+        self.normalizer = NORMALIZER
     
     def analyze(self, repo_path, go_files):
         """Analyze code duplication.
@@ -32,32 +34,32 @@ class DuplicationAnalyzer:
         # Run SCC to get complexity and duplication metrics
         scc_results = GoToolRunner.run_scc(repo_path)
         
-        # Calculate total lines and duplicated lines
+        # Accumulate totals and collect duplicated files in a single pass
         total_lines = 0
         duplicated_lines = 0
-        
-        for file_result in scc_results:
-            total_lines += file_result.get('Code', 0)
-            duplicated_lines += file_result.get('Duplicate', 0)
-        
-        # Calculate duplication percentage
-        duplication_percentage = (duplicated_lines / max(1, total_lines)) * 100
-        
-        # Find files with highest duplication
         files_with_duplication = []
+
         for file_result in scc_results:
-            if file_result.get('Duplicate', 0) > 0:
-                dup_percentage = (file_result.get('Duplicate', 0) / 
-                                 max(1, file_result.get('Code', 0))) * 100
+            code_lines = file_result.get('Code', 0)
+            dup_lines = file_result.get('Duplicate', 0)
+            total_lines += code_lines
+            duplicated_lines += dup_lines
+
+            if dup_lines > 0:
                 files_with_duplication.append({
                     'file': file_result.get('Location', ''),
-                    'duplicated_lines': file_result.get('Duplicate', 0),
-                    'total_lines': file_result.get('Code', 0),
-                    'percentage': dup_percentage
+                    'duplicated_lines': dup_lines,
+                    'total_lines': code_lines,
+                    'percentage': (dup_lines / max(1, code_lines)) * 100
                 })
-        
-        # Sort by percentage of duplication
-        files_with_duplication.sort(key=lambda x: x['percentage'], reverse=True)
+
+        # Calculate duplication percentage
+        duplication_percentage = (duplicated_lines / max(1, total_lines)) * 100
+
+        # Take the top 10 by percentage without sorting the full list
+        files_with_duplication = heapq.nlargest(
+            10, files_with_duplication, key=lambda x: x['percentage']
+        )
         
         # Calculate normalized score (0-100, where 0 is best)
         duplication_score = self.normalizer.normalize_percentage(
@@ -70,6 +72,6 @@ class DuplicationAnalyzer:
             'total_lines': total_lines,
             'duplicated_lines': duplicated_lines,
             'duplication_percentage': duplication_percentage,
-            'files_with_duplication': files_with_duplication[:10],  # Top 10
+            'files_with_duplication': files_with_duplication,  # Top 10
             'score': duplication_score
         }
\ No newline at end of file
@@ -4,10 +4,90 @@ Report Generator
 Generates a comprehensive technical debt report.
 """
 
+import heapq
+import io
 import os
 import datetime
 from scoring.thresholds import DebtThresholds
 
+# Report header, rendered with one %-format instead of a list of
+# f-strings joined per invocation
+_HEADER_TMPL = (
+    "# Technical Debt Report\n"
+    "Repository: %s\n"
+    "Date: %s\n"
+    "Overall Debt Score: %.2f/100 (%s)\n"
+    "\n"
+    "## Summary\n"
+    "\n"
+    "| Category | Score | Level |\n"
+    "| -------- | ----- | ----- |\n"
+)
+
+# Recommendation blocks per category, resolved with one dict lookup in
+# _create_recommendations instead of a branch chain
+_RECOMMENDATIONS = {
+    'complexity': (
+        "### Reduce Code Complexity",
+        "",
+        "- Refactor functions with high cyclomatic complexity",
+        "- Break down large functions into smaller, more focused ones",
+        "- Simplify nested conditionals and loops",
+        "- Consider using design patterns to simplify complex logic",
+        ""
+    ),
+    'duplication': (
+        "### Reduce Code Duplication",
+        "",
+        "- Extract duplicated code into reusable functions or methods",
+        "- Create utility packages for common functionality",
+        "- Apply DRY (Don't Repeat Yourself) principles",
+        "- Consider using code generation for repetitive patterns",
+        ""
+    ),
+    'test_quality': (
+        "### Improve Test Quality",
+        "",
+        "- Add tests for uncovered files and functions",
+        "- Increase test coverage for critical components",
+        "- Implement table-driven tests for better coverage",
+        "- Add integration and end-to-end tests",
+        "- Use test-driven development (TDD) for new features",
+        ""
+    ),
+    'dependencies': (
+        "### Improve Dependency Health",
+        "",
+        "- Update outdated dependencies",
+        "- Fix vulnerable dependencies immediately",
+        "- Implement dependency scanning in CI/CD pipeline",
+        "- Consider using dependency management tools",
+        "- Regularly audit and prune unnecessary dependencies",
+        ""
+    ),
+    'churn': (
+        "### Reduce Code Churn",
+        "",
+        "- Stabilize frequently changing files",
+        "- Improve test coverage for high-churn files",
+        "- Review and refactor hotspots",
+        "- Consider breaking down large, frequently changed files",
+        "- Implement more thorough code reviews for high-churn areas",
+        ""
+    ),
+    'readability': (
+        "### Improve Code Readability",
+        "",
+        "- Fix linting and formatting issues",
+        "- Add meaningful comments and documentation",
+        "- Break down long functions",
+        "- Use descriptive variable and function names",
+        "- Follow Go style guidelines and best practices",
+        "- Run gofmt and golint as part of your workflow",
+        ""
+    )
+}
+
 class ReportGenerator:
     """Generates technical debt reports."""
     
@@ -22,67 +102,84 @@ class ReportGenerator:
     
     def generate(self, results, output_path):
         """Generate a technical debt report.
-        
+
+        The report is streamed section by section to the output file, so
+        no full copy of it is ever held in memory. The file is opened in
+        binary mode and each section chunk is UTF-8 encoded once, which
+        sidesteps TextIOWrapper's per-write encoder machinery.
+
         Args:
             results: Dictionary with scan results
             output_path: Path to write the report
         """
-        # Create report content
-        report = self._create_report(results)
-        
-        # Write to file
-        with open(output_path, 'w') as f:
-            f.write(report)
-    
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            write = f.write
+            self._write_report(results, lambda chunk: write(chunk.encode('utf-8')))
+
     def _create_report(self, results):
-        """Create the report content.
-        
+        """Render the report to a string.
+
+        In-memory counterpart to generate(): the same section writers
+        stream into a StringIO buffer instead of a file.
+
         Args:
             results: Dictionary with scan results
-            
+
         Returns:
-            String with the report content
+            The full report text
+        """
+        buf = io.StringIO()
+        self._write_report(results, buf.write)
+        return buf.getvalue()
+
+    def _write_report(self, results, write):
+        """Write the report content through a write callable.
+
+        Args:
+            results: Dictionary with scan results
+            write: Callable accepting report text chunks
         """
         repo_path = results['repo_path']
         overall_score = results['overall_score']
         category_scores = results['category_scores']
         metrics = results['metrics']
-        
+
         # Determine overall debt level
         overall_level = self.thresholds.get_debt_level(overall_score)
-        
-        # Create report header
-        report = [
-            "# Technical Debt Report",
-            f"Repository: {os.path.basename(repo_path)}",
-            f"Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Overall Debt Score: {overall_score:.2f}/100 ({overall_level.upper()})",
-            "",
-            "## Summary",
-            "",
-            "| Category | Score | Level |",
-            "| -------- | ----- | ----- |",
-        ]
-        
+
+        # Write report header
+        write(_HEADER_TMPL % (
+            os.path.basename(repo_path),
+            datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            overall_score,
+            overall_level.upper()
+        ))
+
         # Add category summaries
+        summary = []
         for category, score in category_scores.items():
             level = self.thresholds.get_debt_level(score)
-            report.append(f"| {category.replace('_', ' ').title()} | {score:.2f} | {level.upper()} |")
-        
-        report.append("")
-        
+            summary.append(f"| {category.replace('_', ' ').title()} | {score:.2f} | {level.upper()} |")
+
+        summary.append("")
+        write("\n".join(summary) + "\n")
+
         # Add detailed sections for each category
-        report.extend(self._create_complexity_section(metrics['complexity']))
-        report.extend(self._create_duplication_section(metrics['duplication']))
-        report.extend(self._create_test_quality_section(metrics['test_quality']))
-        report.extend(self._create_dependencies_section(metrics['dependencies']))
-        report.extend(self._create_churn_section(metrics['churn']))
-        report.extend(self._create_readability_section(metrics['readability']))
-        
+        self._write_section(write, self._create_complexity_section(metrics['complexity']))
+        self._write_section(write, self._create_duplication_section(metrics['duplication']))
+        self._write_section(write, self._create_test_quality_section(metrics['test_quality']))
+        self._write_section(write, self._create_dependencies_section(metrics['dependencies']))
+        self._write_section(write, self._create_churn_section(metrics['churn']))
+        self._write_section(write, self._create_readability_section(metrics['readability']))
+
         # Add recommendations
-        report.extend(self._create_recommendations(results))
-        
-        return "\n".join(report)
+        self._write_section(write, self._create_recommendations(results), final=True)
+
+    @staticmethod
+    def _write_section(write, lines, final=False):
+        """Write one section's lines as a single chunk."""
+        text = "\n".join(lines)
+        write(text if final else text + "\n")
     
     def _create_complexity_section(self, complexity_metrics):
         """Create the complexity section of the report."""
@@ -99,9 +196,11 @@ class ReportGenerator:
             ""
         ]
         
-        for offender in complexity_metrics['cyclomatic']['worst_offenders']:
-            section.append(f"- {offender['file_info']} (Complexity: {offender['complexity']})")
-        
+        section.extend(
+            f"- {offender['file_info']} (Complexity: {offender['complexity']})"
+            for offender in complexity_metrics['cyclomatic']['worst_offenders']
+        )
+
         section.extend([
             "",
             "### Cognitive Complexity",
@@ -112,9 +211,11 @@ class ReportGenerator:
             ""
         ])
         
-        for offender in complexity_metrics['cognitive']['worst_offenders']:
-            section.append(f"- {offender['file_info']} (Complexity: {offender['complexity']})")
-        
+        section.extend(
+            f"- {offender['file_info']} (Complexity: {offender['complexity']})"
+            for offender in complexity_metrics['cognitive']['worst_offenders']
+        )
+
         section.append("")
         return section
     
@@ -132,11 +233,11 @@ class ReportGenerator:
             ""
         ]
         
-        for file_info in duplication_metrics['files_with_duplication']:
-            section.append(
-                f"- {file_info['file']} ({file_info['duplicated_lines']} lines, "
-                f"{file_info['percentage']:.2f}%)"
-            )
+        section.extend(
+            f"- {file_info['file']} ({file_info['duplicated_lines']} lines, "
+            f"{file_info['percentage']:.2f}%)"
+            for file_info in duplication_metrics['files_with_duplication']
+        )
         
         section.append("")
         return section
@@ -157,8 +258,10 @@ class ReportGenerator:
             ""
         ]
         
-        for file_path in test_metrics['uncovered_files'][:10]:  # Show top 10
-            section.append(f"- {file_path}")
+        section.extend(
+            f"- {file_path}"
+            for file_path in test_metrics['uncovered_files'][:10]  # Show top 10
+        )
         
         section.append("")
         return section
@@ -185,18 +288,22 @@ class ReportGenerator:
             ""
         ])
         
-        for dep in dependency_metrics['outdated_dependencies']:
-            section.append(f"- {dep['name']} {dep['current_version']} {dep['update_info']}")
-        
+        section.extend(
+            f"- {dep['name']} {dep['current_version']} {dep['update_info']}"
+            for dep in dependency_metrics['outdated_dependencies']
+        )
+
         if dependency_metrics['vulnerable_count'] > 0:
             section.extend([
                 "",
                 "### Vulnerable Dependencies:",
                 ""
             ])
-            
-            for dep in dependency_metrics['vulnerable_dependencies']:
-                section.append(f"- {dep}")
+
+            section.extend(
+                f"- {dep}"
+                for dep in dependency_metrics['vulnerable_dependencies']
+            )
         
         section.append("")
         return section
@@ -216,11 +323,11 @@ class ReportGenerator:
             ""
         ]
         
-        for file_info in churn_metrics['high_churn_files']:
-            section.append(
-                f"- {file_info['file']} (Churn rate: {file_info['churn_rate']:.2f}, "
-                f"Commits: {file_info['commits']})"
-            )
+        section.extend(
+            f"- {file_info['file']} (Churn rate: {file_info['churn_rate']:.2f}, "
+            f"Commits: {file_info['commits']})"
+            for file_info in churn_metrics['high_churn_files']
+        )
         
         section.append("")
         return section
@@ -240,20 +347,22 @@ class ReportGenerator:
             ""
         ]
         
-        # Sort files by various metrics to find those with readability issues
-        problematic_files = sorted(
+        # Pick the 10 files with readability issues without sorting the
+        # full list; nsmallest keeps the same ordering as the old sort
+        problematic_files = heapq.nsmallest(
+            10,
             readability_metrics['file_metrics'],
             key=lambda x: (
                 -x['avg_function_length'],  # Longer functions first
                 x['comment_ratio']  # Lower comment ratio first
             )
-        )[:10]  # Top 10
+        )
         
-        for file_info in problematic_files:
-            section.append(
-                f"- {file_info['file']} (Avg function length: {file_info['avg_function_length']:.2f}, "
-                f"Comment ratio: {file_info['comment_ratio']:.2f})"
-            )
+        section.extend(
+            f"- {file_info['file']} (Avg function length: {file_info['avg_function_length']:.2f}, "
+            f"Comment ratio: {file_info['comment_ratio']:.2f})"
+            for file_info in problematic_files
+        )
         
         section.append("")
         return section
@@ -274,78 +383,11 @@ class ReportGenerator:
             "## Recommendations",
             ""
         ]
-        
+
         # Add recommendations for the top 3 worst categories
+        medium = self.thresholds.thresholds['medium']
         for category, score in sorted_categories[:3]:
-            if category == 'complexity' and score > self.thresholds.thresholds['medium']:
-                section.extend([
-                    "### Reduce Code Complexity",
-                    "",
-                    "- Refactor functions with high cyclomatic complexity",
-                    "- Break down large functions into smaller, more focused ones",
-                    "- Simplify nested conditionals and loops",
-                    "- Consider using design patterns to simplify complex logic",
-                    ""
-                ])
-            
-            elif category == 'duplication' and score > self.thresholds.thresholds['medium']:
-                section.extend([
-                    "### Reduce Code Duplication",
-                    "",
-                    "- Extract duplicated code into reusable functions or methods",
-                    "- Create utility packages for common functionality",
-                    "- Apply DRY (Don't Repeat Yourself) principles",
-                    "- Consider using code generation for repetitive patterns",
-                    ""
-                ])
-            
-            elif category == 'test_quality' and score > self.thresholds.thresholds['medium']:
-                section.extend([
-                    "### Improve Test Quality",
-                    "",
-                    "- Add tests for uncovered files and functions",
-                    "- Increase test coverage for critical components",
-                    "- Implement table-driven tests for better coverage",
-                    "- Add integration and end-to-end tests",
-                    "- Use test-driven development (TDD) for new features",
-                    ""
-                ])
-            
-            elif category == 'dependencies' and score > self.thresholds.thresholds['medium']:
-                section.extend([
-                    "### Improve Dependency Health",
-                    "",
-                    "- Update outdated dependencies",
-                    "- Fix vulnerable dependencies immediately",
-                    "- Implement dependency scanning in CI/CD pipeline",
-                    "- Consider using dependency management tools",
-                    "- Regularly audit and prune unnecessary dependencies",
-                    ""
-                ])
-            
-            elif category == 'churn' and score > self.thresholds.thresholds['medium']:
-                section.extend([
-                    "### Reduce Code Churn",
-                    "",
-                    "- Stabilize frequently changing files",
-                    "- Improve test coverage for high-churn files",
-                    "- Review and refactor hotspots",
-                    "- Consider breaking down large, frequently changed files",
-                    "- Implement more thorough code reviews for high-churn areas",
-                    ""
-                ])
-            
-            elif category == 'readability' and score > self.thresholds.thresholds['medium']:
-                section.extend([
-                    "### Improve Code Readability",
-                    "",
-                    "- Fix linting and formatting issues",
-                    "- Add meaningful comments and documentation",
-                    "- Break down long functions",
-                    "- Use descriptive variable and function names",
-                    "- Follow Go style guidelines and best practices",
-                    "- Run gofmt and golint as part of your workflow",
-                    ""
-                ])
-        
+            if score > medium and category in _RECOMMENDATIONS:
+                section.extend(_RECOMMENDATIONS[category])
+
         return section
\ No newline at end of file
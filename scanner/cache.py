@@ -0,0 +1,69 @@
+"""
+Churn Cache
+
+On-disk cache for git-derived metrics, keyed by the branch tip SHA.
+"""
+
+import hashlib
+import json
+import os
+
+_CACHE_ROOT = os.path.join(
+    os.path.expanduser('~'), '.cache', 'go-lang-techdebt-scanner'
+)
+
+class ChurnCache:
+    """Tip-keyed cache for git query results.
+
+    A query result stays valid for as long as the branch tip it was
+    computed against is unchanged, so entries are invalidated purely by
+    the tip SHA in the file name -- no TTL bookkeeping. Re-scanning an
+    unchanged repository then costs one rev-parse plus a JSON load.
+    """
+
+    def __init__(self, repo_path):
+        """Initialize the cache for one repository.
+
+        Args:
+            repo_path: Path to the Git repository
+        """
+        repo_hash = hashlib.sha1(
+            os.path.abspath(repo_path).encode()
+        ).hexdigest()[:16]
+        self.cache_dir = os.path.join(_CACHE_ROOT, repo_hash)
+
+    def _entry_path(self, tip, key):
+        """Build the file path for one (tip, query-key) entry."""
+        key_hash = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{tip}-{key_hash}.json")
+
+    def get(self, tip, key):
+        """Load a cached result, or None on miss.
+
+        Args:
+            tip: Branch tip SHA the result must match
+            key: Hashable query key (query name plus its arguments)
+
+        Returns:
+            The cached value, or None if absent or unreadable
+        """
+        try:
+            with open(self._entry_path(tip, key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, tip, key, value):
+        """Store a result; failures are non-fatal.
+
+        Args:
+            tip: Branch tip SHA the result was computed against
+            key: Hashable query key (query name plus its arguments)
+            value: JSON-serializable result to store
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._entry_path(tip, key), 'w') as f:
+                json.dump(value, f)
+        except OSError:
+            pass
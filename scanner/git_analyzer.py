@@ -4,22 +4,130 @@ Git Analyzer
 Analyzes Git history to determine code churn and stability metrics.
 """
 
+import heapq
 import subprocess
-import re
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+
+from scanner.cache import ChurnCache
 
 class GitAnalyzer:
     """Analyzer for Git repositories."""
-    
-    def __init__(self, repo_path):
+
+    # Shared instances keyed by repo path, so analyzers that each need
+    # git data reuse one analyzer (and its memoized query results).
+    # LRU-bounded: a server scanning many different repos does not
+    # accumulate an analyzer (and its query cache) per path forever.
+    _instances = OrderedDict()
+    _max_instances = 16
+
+    # Rebuild a shared instance once its reference time is this stale,
+    # so the --since windows keep tracking the clock on long-lived
+    # servers instead of shrinking as the frozen 'now' recedes
+    _max_instance_age = timedelta(hours=1)
+
+    @classmethod
+    def for_repo(cls, repo_path):
+        """Return a shared analyzer for the repository.
+
+        HEAD is re-resolved on every call; the shared instance is
+        replaced when the tip has moved or its reference time has aged
+        out, so new scans see current history with fresh date windows
+        (earlier results still come back through the tip-keyed disk
+        cache). Least recently used entries are evicted beyond the cap.
+
+        Args:
+            repo_path: Path to the Git repository
+
+        Returns:
+            A GitAnalyzer shared by all callers for this path
+        """
+        analyzer = cls._instances.get(repo_path)
+        if (analyzer is not None
+                and datetime.now() - analyzer._now < cls._max_instance_age
+                and analyzer._tip() == analyzer._resolve_tip()):
+            cls._instances.move_to_end(repo_path)
+            return analyzer
+        analyzer = cls(repo_path)
+        cls._instances[repo_path] = analyzer
+        cls._instances.move_to_end(repo_path)
+        while len(cls._instances) > cls._max_instances:
+            cls._instances.popitem(last=False)
+        return analyzer
+
+    def __init__(self, repo_path, now=None):
         """Initialize the Git analyzer.
-        
+
         Args:
             repo_path: Path to the Git repository
+            now: Optional fixed reference time for date windows; defaults
+                to the construction time
         """
         self.repo_path = repo_path
-    
+        # One reference time for the analyzer's lifetime keeps the
+        # --since dates (and therefore the cache keys derived from them)
+        # stable across calls
+        self._now = now or datetime.now()
+        self._since_dates = {}
+        self._query_cache = {}
+        self._disk_cache = ChurnCache(repo_path)
+
+    def _since_date(self, days):
+        """Return the --since date for a day window, memoized."""
+        since = self._since_dates.get(days)
+        if since is None:
+            since = (self._now - timedelta(days=days)).strftime('%Y-%m-%d')
+            self._since_dates[days] = since
+        return since
+
+    def _resolve_tip(self):
+        """Ask git for the current branch tip SHA, or '' outside a repo."""
+        return self._run_git_command(['rev-parse', 'HEAD']).strip()
+
+    def _tip(self):
+        """Return the tip SHA this analyzer is pinned to.
+
+        Resolved once per instance; for_repo rebuilds the instance when
+        HEAD moves, so the pinned tip is always the one the current
+        scan's results belong to.
+        """
+        tip = self._query_cache.get('tip')
+        if tip is None:
+            tip = self._resolve_tip()
+            self._query_cache['tip'] = tip
+        return tip
+
+    def _cached_query(self, cache_key, compute):
+        """Resolve a query through the in-process and on-disk caches.
+
+        In-memory entries are keyed by the tip as well, so results
+        computed against one tip can never be served for another.
+
+        Args:
+            cache_key: Hashable key naming the query and its arguments
+            compute: Zero-argument callable producing the result
+
+        Returns:
+            The cached or freshly computed result
+        """
+        tip = self._tip()
+        memo_key = (tip,) + cache_key
+        cached = self._query_cache.get(memo_key)
+        if cached is not None:
+            return cached
+
+        if tip:
+            cached = self._disk_cache.get(tip, cache_key)
+            if cached is not None:
+                self._query_cache[memo_key] = cached
+                return cached
+
+        result = compute()
+        self._query_cache[memo_key] = result
+        if tip:
+            self._disk_cache.put(tip, cache_key, result)
+        return result
+
     def _run_git_command(self, cmd):
         """Run a git command and return its output."""
         full_cmd = ['git'] + cmd
@@ -34,32 +142,70 @@ class GitAnalyzer:
             return result.stdout
         except subprocess.CalledProcessError:
             return ""
-    
+
+    def _run_git_stream(self, cmd):
+        """Run a git command and yield its output lines as bytes.
+
+        Unlike _run_git_command, the output is never materialized as a
+        single string: parsing overlaps with git's own history walk and
+        peak memory stays at one line. The stream also stays as bytes,
+        skipping the full UTF-8 decode; callers decode only the few
+        fields they keep.
+        """
+        full_cmd = ['git'] + cmd
+        try:
+            proc = subprocess.Popen(
+                full_cmd,
+                cwd=self.repo_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return
+        try:
+            for line in proc.stdout:
+                yield line.rstrip(b'\n')
+        finally:
+            proc.stdout.close()
+            proc.wait()
+
     def get_file_churn(self, file_path, days=90):
         """Get churn metrics for a specific file.
-        
+
         Args:
             file_path: Path to the file
             days: Number of days to analyze
-            
+
         Returns:
             Dictionary with churn metrics
         """
-        # Get the date range
-        since_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-        
-        # Get commit history for the file
+        return self._cached_query(
+            ('file_churn', days, file_path),
+            lambda: self._compute_file_churn(file_path, days)
+        )
+
+    def _compute_file_churn(self, file_path, days):
+        """Compute file churn with a single git log invocation."""
+        since_date = self._since_date(days)
+
+        # One git log walks the file's history and interleaves each
+        # commit line with its numstat rows, replacing the old pattern
+        # of a log call plus one git show per commit
         cmd = [
-            'log', 
-            f'--since={since_date}', 
-            '--format=%H|%an|%ad|%s', 
-            '--date=short', 
-            '--', 
+            'log',
+            f'--since={since_date}',
+            '--numstat',
+            '--format=%H|%an|%ad|%s',
+            '--date=short',
+            '--',
             file_path
         ]
         output = self._run_git_command(cmd)
-        
+
         commits = []
+        total_additions = 0
+        total_deletions = 0
+
         for line in output.splitlines():
             if '|' in line:
                 parts = line.split('|')
@@ -70,27 +216,17 @@ class GitAnalyzer:
                         'date': parts[2],
                         'message': parts[3]
                     })
-        
-        # Get line changes
-        total_additions = 0
-        total_deletions = 0
-        
-        for commit in commits:
-            cmd = ['show', '--numstat', '--format=', commit['hash'], '--', file_path]
-            output = self._run_git_command(cmd)
-            
-            for line in output.splitlines():
-                if line.strip():
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        try:
-                            additions = int(parts[0]) if parts[0] != '-' else 0
-                            deletions = int(parts[1]) if parts[1] != '-' else 0
-                            total_additions += additions
-                            total_deletions += deletions
-                        except ValueError:
-                            pass
-        
+            elif line.strip():
+                parts = line.split()
+                if len(parts) >= 3:
+                    try:
+                        additions = int(parts[0]) if parts[0] != '-' else 0
+                        deletions = int(parts[1]) if parts[1] != '-' else 0
+                        total_additions += additions
+                        total_deletions += deletions
+                    except ValueError:
+                        pass
+
         # Calculate churn rate
         churn_rate = (total_additions + total_deletions) / max(1, len(commits))
         
@@ -101,6 +237,63 @@ class GitAnalyzer:
             'churn_rate': churn_rate
         }
     
+    def get_all_file_churn(self, days=90):
+        """Get churn metrics for every file changed in the period.
+
+        A single ``git log --numstat`` invocation walks the history once
+        and reports additions/deletions for all files, instead of one
+        subprocess (and one history walk) per file.
+
+        Args:
+            days: Number of days to analyze
+
+        Returns:
+            Dictionary mapping repo-relative file path to churn metrics
+        """
+        return self._cached_query(
+            ('all_file_churn', days),
+            lambda: self._compute_all_file_churn(days)
+        )
+
+    def _compute_all_file_churn(self, days):
+        """Compute per-file churn from one repo-wide git log pass."""
+        since_date = self._since_date(days)
+
+        # The '@@' prefix marks commit lines with a cheap literal check;
+        # numstat rows are tab-separated, so split on '\t' rather than
+        # arbitrary whitespace (which also keeps paths with spaces whole)
+        cmd = ['log', f'--since={since_date}', '--numstat', '--format=@@%H']
+
+        file_churn = defaultdict(lambda: {'additions': 0, 'deletions': 0, 'commits': 0})
+        current_commit = None
+
+        for line in self._run_git_stream(cmd):
+            if line.startswith(b'@@'):
+                current_commit = line[2:]
+            elif line.strip() and current_commit:
+                parts = line.split(b'\t', 2)
+                if len(parts) >= 3:
+                    try:
+                        additions = int(parts[0]) if parts[0] != b'-' else 0
+                        deletions = int(parts[1]) if parts[1] != b'-' else 0
+                    except ValueError:
+                        continue
+
+                    data = file_churn[parts[2]]
+                    data['additions'] += additions
+                    data['deletions'] += deletions
+                    data['commits'] += 1
+
+        # Calculate churn rate per file; paths are decoded here, once
+        # per unique file rather than once per numstat row
+        for data in file_churn.values():
+            data['churn_rate'] = (data['additions'] + data['deletions']) / max(1, data['commits'])
+
+        return {
+            path.decode('utf-8', 'replace'): data
+            for path, data in file_churn.items()
+        }
+
     def get_repo_churn(self, days=90, file_extension='.go'):
         """Get churn metrics for the entire repository.
         
@@ -111,104 +304,132 @@ class GitAnalyzer:
         Returns:
             Dictionary with churn metrics
         """
-        # Get the date range
-        since_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-        
-        # Get commit count
-        cmd = ['rev-list', '--count', f'--since={since_date}', 'HEAD']
-        output = self._run_git_command(cmd)
-        commit_count = int(output.strip()) if output.strip().isdigit() else 0
-        
-        # Get author count
-        cmd = [
-            'shortlog', 
-            '-sn', 
-            f'--since={since_date}', 
-            'HEAD'
-        ]
-        output = self._run_git_command(cmd)
-        author_count = len(output.splitlines())
-        
-        # Get file changes
+        return self._cached_query(
+            ('repo_churn', days, file_extension),
+            lambda: self._compute_repo_churn(days, file_extension)
+        )
+
+    def _compute_repo_churn(self, days, file_extension):
+        """Compute repository-level churn metrics."""
+        since_date = self._since_date(days)
+
+        # One git log pass yields the commit count, the author set and
+        # every numstat row; the commit marker carries the author after
+        # a NUL byte, replacing the separate rev-list and shortlog calls
         cmd = [
-            'log', 
-            f'--since={since_date}', 
-            '--numstat', 
-            '--format=%H'
+            'log',
+            f'--since={since_date}',
+            '--numstat',
+            '--format=@C%H%x00%an'
         ]
-        output = self._run_git_command(cmd)
-        
+
+        commit_count = 0
+        authors = set()
         total_additions = 0
         total_deletions = 0
-        file_changes = defaultdict(lambda: {'additions': 0, 'deletions': 0, 'commits': 0})
+        # Parallel per-path counters instead of a dict-per-file: one row
+        # touches three flat tables, with no tiny dict allocated per file
+        adds = {}
+        dels = {}
+        cmts = {}
         current_commit = None
-        
-        for line in output.splitlines():
-            if re.match(r'^[0-9a-f]{40}$', line):
-                current_commit = line
+
+        extension = file_extension.encode()
+
+        for line in self._run_git_stream(cmd):
+            if line.startswith(b'@C'):
+                current_commit, _, author = line[2:].partition(b'\x00')
+                commit_count += 1
+                authors.add(author)
             elif line.strip() and current_commit:
-                parts = line.split()
+                parts = line.split(b'\t', 2)
                 if len(parts) >= 3:
                     file_path = parts[2]
-                    if file_path.endswith(file_extension):
+                    if file_path.endswith(extension):
                         try:
-                            additions = int(parts[0]) if parts[0] != '-' else 0
-                            deletions = int(parts[1]) if parts[1] != '-' else 0
+                            additions = int(parts[0]) if parts[0] != b'-' else 0
+                            deletions = int(parts[1]) if parts[1] != b'-' else 0
                             
                             total_additions += additions
                             total_deletions += deletions
-                            
-                            file_changes[file_path]['additions'] += additions
-                            file_changes[file_path]['deletions'] += deletions
-                            file_changes[file_path]['commits'] += 1
+
+                            adds[file_path] = adds.get(file_path, 0) + additions
+                            dels[file_path] = dels.get(file_path, 0) + deletions
+                            cmts[file_path] = cmts.get(file_path, 0) + 1
                         except ValueError:
                             pass
-        
-        # Calculate hotspots (files with high churn)
+
+        # Calculate hotspots (files with high churn); paths are decoded
+        # here, once per changed file rather than once per numstat row
         hotspots = []
-        for file_path, changes in file_changes.items():
-            churn = changes['additions'] + changes['deletions']
+        for file_path, additions in adds.items():
+            churn = additions + dels[file_path]
             if churn > 0:
                 hotspots.append({
-                    'file': file_path,
+                    'file': file_path.decode('utf-8', 'replace'),
                     'churn': churn,
-                    'commits': changes['commits']
+                    'commits': cmts[file_path]
                 })
-        
-        # Sort hotspots by churn
-        hotspots.sort(key=lambda x: x['churn'], reverse=True)
-        
+
+        # Take the top 10 by churn without sorting the full list
+        hotspots = heapq.nlargest(10, hotspots, key=lambda x: x['churn'])
+
         # Calculate churn rate
         churn_rate = (total_additions + total_deletions) / max(1, commit_count)
-        
+
         return {
             'commit_count': commit_count,
-            'author_count': author_count,
+            'author_count': len(authors),
             'total_additions': total_additions,
             'total_deletions': total_deletions,
             'churn_rate': churn_rate,
-            'hotspots': hotspots[:10]  # Top 10 hotspots
+            'hotspots': hotspots
         }
     
     def get_file_age(self, file_path):
         """Get the age of a file in days."""
-        cmd = ['log', '--follow', '--format=%ad', '--date=short', '--reverse', '--', file_path]
+        cache_key = ('file_age', self._tip(), file_path)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        age_days = self._compute_file_age(file_path)
+        self._query_cache[cache_key] = age_days
+        return age_days
+
+    def _compute_file_age(self, file_path):
+        """Compute a file's age from the commit that added it.
+
+        --diff-filter=A with -1 asks git for just the Add commit, so a
+        single date comes back instead of one line per touching commit.
+        """
+        cmd = [
+            'log', '--diff-filter=A', '--follow', '-1',
+            '--format=%ad', '--date=short', '--', file_path
+        ]
         output = self._run_git_command(cmd)
-        
+
         if not output:
             return 0
-        
+
         first_commit_date = output.splitlines()[0]
         try:
             first_date = datetime.strptime(first_commit_date, '%Y-%m-%d')
-            age_days = (datetime.now() - first_date).days
+            age_days = (self._now - first_date).days
             return age_days
         except ValueError:
             return 0
     
     def get_file_contributors(self, file_path):
         """Get the number of contributors to a file."""
+        cache_key = ('file_contributors', self._tip(), file_path)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         cmd = ['shortlog', '-sn', '--', file_path]
         output = self._run_git_command(cmd)
-        
-        return len(output.splitlines())
\ No newline at end of file
+
+        count = len(output.splitlines())
+        self._query_cache[cache_key] = count
+        return count
\ No newline at end of file
@@ -7,9 +7,53 @@ Provides interfaces to various Go analysis tools.
 import subprocess
 import json
 import os
-import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    # orjson parses large tool outputs ~3x faster than stdlib json
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Concurrency for the lint/fmt fan-out; eight concurrent subprocesses
+# is plenty before the tools contend on disk
+_TOOL_POOL_WORKERS = min(8, os.cpu_count() or 4)
+
+def _chunk_under_arg_max(files, fixed_prefix_len=64):
+    """Group file paths into argv chunks below the platform limit.
+
+    Both gofmt and golint accept many files per invocation, so the
+    subprocess count scales with ARG_MAX-sized chunks rather than with
+    the number of files.
+
+    Args:
+        files: Iterable of file paths
+        fixed_prefix_len: Bytes reserved for the command name and flags
+
+    Yields:
+        Lists of paths, each fitting one command line
+    """
+    try:
+        limit = os.sysconf('SC_ARG_MAX') // 2
+    except (AttributeError, OSError, ValueError):
+        limit = 64 * 1024
+
+    chunk = []
+    used = fixed_prefix_len
+    for path in files:
+        cost = len(path) + 1
+        if chunk and used + cost > limit:
+            yield chunk
+            chunk = []
+            used = fixed_prefix_len
+        chunk.append(path)
+        used += cost
+    if chunk:
+        yield chunk
+
 class GoToolRunner:
     """Runner for Go analysis tools."""
     
@@ -42,20 +86,24 @@ class GoToolRunner:
         
         for line in output.splitlines():
             if line.startswith('Average'):
-                avg_match = re.search(r'Average: (\d+\.\d+)', line)
-                if avg_match:
-                    avg_complexity = float(avg_match.group(1))
+                # 'Average: <n>' -- the prefix already identifies the
+                # line, so take the number directly instead of paying a
+                # regex search per match
+                try:
+                    avg_complexity = float(line.split(': ', 1)[1].split()[0])
+                except (IndexError, ValueError):
+                    pass
             else:
-                parts = line.split()
-                if len(parts) >= 2:
+                # '<complexity> <file_info...>': one partition isolates
+                # the leading integer without tokenizing the whole line
+                complexity_str, _, file_info = line.partition(' ')
+                if file_info:
                     try:
-                        complexity = int(parts[0])
-                        file_info = ' '.join(parts[1:])
                         results.append({
-                            'complexity': complexity,
+                            'complexity': int(complexity_str),
                             'file_info': file_info
                         })
-                    except (ValueError, IndexError):
+                    except ValueError:
                         pass
         
         return {
@@ -75,20 +123,24 @@ class GoToolRunner:
         
         for line in output.splitlines():
             if line.startswith('Average'):
-                avg_match = re.search(r'Average: (\d+\.\d+)', line)
-                if avg_match:
-                    avg_complexity = float(avg_match.group(1))
+                # 'Average: <n>' -- the prefix already identifies the
+                # line, so take the number directly instead of paying a
+                # regex search per match
+                try:
+                    avg_complexity = float(line.split(': ', 1)[1].split()[0])
+                except (IndexError, ValueError):
+                    pass
             else:
-                parts = line.split()
-                if len(parts) >= 2:
+                # '<complexity> <file_info...>': one partition isolates
+                # the leading integer without tokenizing the whole line
+                complexity_str, _, file_info = line.partition(' ')
+                if file_info:
                     try:
-                        complexity = int(parts[0])
-                        file_info = ' '.join(parts[1:])
                         results.append({
-                            'complexity': complexity,
+                            'complexity': int(complexity_str),
                             'file_info': file_info
                         })
-                    except (ValueError, IndexError):
+                    except ValueError:
                         pass
         
         return {
@@ -103,11 +155,11 @@ class GoToolRunner:
         output = GoToolRunner.run_command(cmd)
         
         try:
-            results = json.loads(output)
+            results = _json_loads(output)
             # Filter for Go files only
             go_results = [r for r in results if r.get('Language') == 'Go']
             return go_results
-        except json.JSONDecodeError:
+        except ValueError:
             return []
     
     @staticmethod
@@ -115,57 +167,89 @@ class GoToolRunner:
         """Run golangci-lint for comprehensive linting."""
         cmd = ['golangci-lint', 'run', '--out-format', 'json', repo_path]
         output = GoToolRunner.run_command(cmd, cwd=repo_path)
-        
+
         try:
-            results = json.loads(output)
+            results = _json_loads(output)
             return results
-        except json.JSONDecodeError:
-            return {'Issues': []}
+        except ValueError:
+            # Some golangci-lint versions append plain-text warnings
+            # after the JSON document; raw_decode reads the document and
+            # ignores the trailing noise
+            try:
+                results, _ = json.JSONDecoder().raw_decode(output)
+                return results
+            except ValueError:
+                return {'Issues': []}
     
     @staticmethod
     def run_golint(go_files):
         """Run golint for style checking."""
+        def lint_chunk(chunk):
+            output = GoToolRunner.run_command(['golint'] + chunk)
+            if not output.strip():
+                return []
+            chunk_results = []
+            for line in output.splitlines():
+                # golint prefixes every message with '<path>:line:col:'
+                file_path, sep, _ = line.partition(':')
+                chunk_results.append({
+                    'file': file_path if sep else '',
+                    'message': line
+                })
+            return chunk_results
+
+        # One golint process per ARG_MAX-sized chunk of files, with the
+        # chunks dispatched concurrently; map keeps input order
         results = []
-        for file_path in go_files:
-            cmd = ['golint', file_path]
-            output = GoToolRunner.run_command(cmd)
-            if output.strip():
-                for line in output.splitlines():
-                    results.append({
-                        'file': file_path,
-                        'message': line
-                    })
-        
+        with ThreadPoolExecutor(max_workers=_TOOL_POOL_WORKERS) as executor:
+            for chunk_results in executor.map(
+                    lint_chunk, _chunk_under_arg_max(go_files)):
+                results.extend(chunk_results)
+
         return results
-    
+
     @staticmethod
     def run_gofmt(go_files):
         """Run gofmt to check formatting issues."""
+        def fmt_chunk(chunk):
+            # -l lists only the offending files in one pass; the diff is
+            # then produced just for those, which on a mostly-formatted
+            # repo means almost no second-stage invocations
+            listing = GoToolRunner.run_command(['gofmt', '-l'] + chunk)
+            chunk_results = []
+            for file_path in listing.splitlines():
+                if not file_path.strip():
+                    continue
+                diff = GoToolRunner.run_command(['gofmt', '-d', file_path])
+                if diff.strip():
+                    chunk_results.append({'file': file_path, 'diff': diff})
+            return chunk_results
+
+        # Same chunked dispatch as run_golint
         results = []
-        for file_path in go_files:
-            cmd = ['gofmt', '-d', file_path]
-            output = GoToolRunner.run_command(cmd)
-            if output.strip():
-                results.append({
-                    'file': file_path,
-                    'diff': output
-                })
-        
+        with ThreadPoolExecutor(max_workers=_TOOL_POOL_WORKERS) as executor:
+            for chunk_results in executor.map(
+                    fmt_chunk, _chunk_under_arg_max(go_files)):
+                results.extend(chunk_results)
+
         return results
     
     @staticmethod
     def run_go_test(repo_path):
         """Run go test with coverage."""
-        # Create a temporary coverage file
-        coverage_file = os.path.join(repo_path, 'coverage.out')
-        
-        # Run tests with coverage
-        cmd = ['go', 'test', './...', '-coverprofile', coverage_file]
-        GoToolRunner.run_command(cmd, cwd=repo_path, capture_output=False)
-        
-        # Parse coverage
-        coverage_data = {}
-        if os.path.exists(coverage_file):
+        # The coverage profile goes to an OS temp file rather than the
+        # repository tree, so an interrupted run cannot leave a stray
+        # coverage.out in the user's working copy
+        fd, coverage_file = tempfile.mkstemp(prefix='gotechdebt-', suffix='.out')
+        os.close(fd)
+
+        try:
+            # Run tests with coverage
+            cmd = ['go', 'test', './...', '-coverprofile', coverage_file]
+            GoToolRunner.run_command(cmd, cwd=repo_path, capture_output=False)
+
+            # Parse coverage
+            coverage_data = {}
             with open(coverage_file, 'r') as f:
                 for line in f:
                     if line.startswith('mode:'):
@@ -175,10 +259,13 @@ class GoToolRunner:
                         file_path = parts[0]
                         coverage_info = parts[1]
                         coverage_data[file_path] = coverage_info
-            
+        finally:
             # Clean up
-            os.remove(coverage_file)
-        
+            try:
+                os.remove(coverage_file)
+            except OSError:
+                pass
+
         return coverage_data
     
     @staticmethod
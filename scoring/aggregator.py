@@ -14,7 +14,13 @@ class ScoreAggregator:
             config: Configuration dictionary
         """
         self.config = config
-    
+
+        # The weights never change for the aggregator's lifetime, so fix
+        # the iteration order and the reciprocal of their sum up front
+        weights = config['weights']
+        self._weight_items = tuple(weights.items())
+        self._weight_sum_recip = 1.0 / sum(weights.values())
+
     def aggregate(self, metrics):
         """Aggregate individual metric scores into category and overall scores.
         
@@ -34,15 +40,10 @@ class ScoreAggregator:
             'readability': metrics['readability']['score']
         }
         
-        # Calculate overall score using weights from config
-        weights = self.config['weights']
-        overall_score = (
-            category_scores['complexity'] * weights['complexity'] +
-            category_scores['duplication'] * weights['duplication'] +
-            category_scores['test_quality'] * weights['test_quality'] +
-            category_scores['dependencies'] * weights['dependencies'] +
-            category_scores['churn'] * weights['churn'] +
-            category_scores['readability'] * weights['readability']
-        ) / sum(weights.values())
-        
+        # Calculate overall score using the precomputed weights
+        overall_score = sum(
+            category_scores[name] * weight
+            for name, weight in self._weight_items
+        ) * self._weight_sum_recip
+
         return overall_score, category_scores
\ No newline at end of file
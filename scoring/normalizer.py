@@ -4,10 +4,17 @@ Score Normalizer
 Normalizes raw metrics to a 0-100 scale where 0 is best (no debt) and 100 is worst.
 """
 
+try:
+    # Optional: bulk normalization runs as one vectorized expression
+    import numpy as _np
+except ImportError:
+    _np = None
+
 class ScoreNormalizer:
     """Normalizes raw metrics to a 0-100 scale."""
     
-    def normalize(self, value, min_value, max_value):
+    @staticmethod
+    def normalize(value, min_value, max_value):
         """Normalize a value to a 0-100 scale.
         
         Args:
@@ -18,13 +25,48 @@ class ScoreNormalizer:
         Returns:
             Normalized value between 0 and 100
         """
-        if max_value == min_value:
+        span = max_value - min_value
+        if span == 0:
             return 0
-        
-        normalized = ((value - min_value) / (max_value - min_value)) * 100
-        return max(0, min(100, normalized))
-    
-    def normalize_inverse(self, value, min_value, max_value):
+
+        # Multiply by the reciprocal of the span; cheaper than a divide
+        # in this per-metric hot path
+        return max(0, min(100, (value - min_value) * (100.0 / span)))
+
+    @staticmethod
+    def normalize_array(values, min_value, max_value):
+        """Normalize a sequence of values to a 0-100 scale.
+
+        With NumPy installed the whole batch is one vectorized clip;
+        otherwise it falls back to normalize per element.
+
+        Args:
+            values: Sequence of values to normalize
+            min_value: The minimum value (will be normalized to 0)
+            max_value: The maximum value (will be normalized to 100)
+
+        Returns:
+            List of normalized values between 0 and 100
+        """
+        span = max_value - min_value
+        if span == 0:
+            return [0] * len(values)
+
+        if _np is not None:
+            arr = _np.clip(
+                (_np.asarray(values, dtype=float) - min_value) * (100.0 / span),
+                0, 100
+            )
+            return arr.tolist()
+
+        scale = 100.0 / span
+        return [
+            max(0, min(100, (value - min_value) * scale))
+            for value in values
+        ]
+
+    @staticmethod
+    def normalize_inverse(value, min_value, max_value):
         """Normalize a value to a 0-100 scale, but inverted (100 - normalized).
         
         Args:
@@ -35,9 +77,10 @@ class ScoreNormalizer:
         Returns:
             Normalized value between 0 and 100
         """
-        return 100 - self.normalize(value, min_value, max_value)
+        return 100 - ScoreNormalizer.normalize(value, min_value, max_value)
     
-    def normalize_complexity(self, value, ideal, worst):
+    @staticmethod
+    def normalize_complexity(value, ideal, worst):
         """Normalize complexity metrics.
         
         Args:
@@ -48,9 +91,10 @@ class ScoreNormalizer:
         Returns:
             Normalized value between 0 and 100
         """
-        return self.normalize(value, ideal, worst)
+        return ScoreNormalizer.normalize(value, ideal, worst)
     
-    def normalize_percentage(self, value, ideal, worst):
+    @staticmethod
+    def normalize_percentage(value, ideal, worst):
         """Normalize percentage metrics.
         
         Args:
@@ -61,9 +105,10 @@ class ScoreNormalizer:
         Returns:
             Normalized value between 0 and 100
         """
-        return self.normalize(value, ideal, worst)
+        return ScoreNormalizer.normalize(value, ideal, worst)
     
-    def normalize_inverse_percentage(self, value, ideal, worst):
+    @staticmethod
+    def normalize_inverse_percentage(value, ideal, worst):
         """Normalize percentage metrics where higher is better.
         
         Args:
@@ -74,9 +119,10 @@ class ScoreNormalizer:
         Returns:
             Normalized value between 0 and 100
         """
-        return self.normalize_inverse(value, worst, ideal)
+        return ScoreNormalizer.normalize_inverse(value, worst, ideal)
     
-    def normalize_count(self, value, ideal, worst):
+    @staticmethod
+    def normalize_count(value, ideal, worst):
         """Normalize count metrics.
         
         Args:
@@ -87,9 +133,10 @@ class ScoreNormalizer:
         Returns:
             Normalized value between 0 and 100
         """
-        return self.normalize(value, ideal, worst)
+        return ScoreNormalizer.normalize(value, ideal, worst)
     
-    def normalize_ratio(self, value, ideal, worst):
+    @staticmethod
+    def normalize_ratio(value, ideal, worst):
         """Normalize ratio metrics.
         
         Args:
@@ -102,11 +149,12 @@ class ScoreNormalizer:
         """
         # If ideal > worst, we want higher values to be better
         if ideal > worst:
-            return self.normalize_inverse(value, worst, ideal)
+            return ScoreNormalizer.normalize_inverse(value, worst, ideal)
         else:
-            return self.normalize(value, ideal, worst)
+            return ScoreNormalizer.normalize(value, ideal, worst)
     
-    def normalize_churn(self, value, ideal, worst):
+    @staticmethod
+    def normalize_churn(value, ideal, worst):
         """Normalize churn metrics.
         
         Args:
@@ -117,4 +165,9 @@ class ScoreNormalizer:
         Returns:
             Normalized value between 0 and 100
         """
-        return self.normalize(value, ideal, worst)
\ No newline at end of file
+        return ScoreNormalizer.normalize(value, ideal, worst)
+
+
+# Shared instance; the normalizer is stateless, so analyzers reuse this
+# instead of constructing their own
+NORMALIZER = ScoreNormalizer()
@@ -4,44 +4,47 @@ Threshold Definitions
 Defines thresholds for high, medium, and low technical debt.
 """
 
+import bisect
+
 class DebtThresholds:
     """Defines thresholds for technical debt levels."""
-    
+
     def __init__(self, config):
         """Initialize the debt thresholds.
-        
+
         Args:
             config: Configuration dictionary
         """
         self.config = config
         self.thresholds = config['thresholds']
-    
+
+        # Level lookup table: bisect over the sorted cuts resolves a
+        # score in one C call instead of two dict lookups plus branches
+        self._levels = ('low', 'medium', 'high')
+        self._cuts = [self.thresholds['medium'], self.thresholds['high']]
+
+        # Per-category thresholds resolved ahead of time, so lookups are
+        # a single dict get with the repo-wide thresholds as default
+        self._cat_thresholds = dict(config.get('category_thresholds', {}))
+
     def get_debt_level(self, score):
         """Get the debt level for a score.
-        
+
         Args:
             score: The debt score (0-100)
-            
+
         Returns:
             String: 'low', 'medium', or 'high'
         """
-        if score >= self.thresholds['high']:
-            return 'high'
-        elif score >= self.thresholds['medium']:
-            return 'medium'
-        else:
-            return 'low'
-    
+        return self._levels[bisect.bisect_right(self._cuts, score)]
+
     def get_category_thresholds(self, category):
         """Get the thresholds for a specific category.
-        
+
         Args:
             category: The category name
-            
+
         Returns:
             Dictionary with category-specific thresholds
         """
-        if category in self.config['category_thresholds']:
-            return self.config['category_thresholds'][category]
-        else:
-            return self.thresholds
\ No newline at end of file
+        return self._cat_thresholds.get(category, self.thresholds)